@@ -11,7 +11,10 @@ increasing falling speed.
 Author: Toshihiro Kamiya (kamiya@mbj.nifty.com)
 """
 
+import collections
 from enum import Enum
+import functools
+import itertools
 import random
 import sys
 from typing import List, Optional, Tuple
@@ -30,7 +33,16 @@ VISIBLE_ROW_OFFSET: int = 2  # Number of top rows to hide
 WINDOW_WIDTH: int = GRID_WIDTH * BLOCK_SIZE
 WINDOW_HEIGHT: int = (GRID_HEIGHT - VISIBLE_ROW_OFFSET) * BLOCK_SIZE
 
-FPS: int = 60
+# Pixel offset per column / per grid row, precomputed once for the cell
+# draw loops; ROW_PX is indexed by internal row and folds in the hidden-row
+# offset (hidden rows map to negative, off-screen offsets).
+COL_PX: Tuple[int, ...] = tuple(x * BLOCK_SIZE for x in range(GRID_WIDTH))
+ROW_PX: Tuple[int, ...] = tuple((y - VISIBLE_ROW_OFFSET) * BLOCK_SIZE for y in range(GRID_HEIGHT))
+
+# Upper cap on redraw rate. Piece falling (800 ms down to 100 ms per row)
+# and key repeat never demand 60 Hz, so 30 halves the render work while
+# animating; redraws are already skipped entirely when nothing changed.
+FPS: int = 30
 
 # Preview area constants
 PREVIEW_MARGIN: int = 20
@@ -41,6 +53,19 @@ PREVIEW_EXTRA: int = 50        # Additional margin on the right
 # Extended window width to accommodate the preview area
 WINDOW_WIDTH_EXTENDED: int = WINDOW_WIDTH + PREVIEW_MARGIN * 2 + PREVIEW_BOX_WIDTH + PREVIEW_EXTRA
 
+# Static layout rects, built once instead of per frame
+PREVIEW_X: int = WINDOW_WIDTH + PREVIEW_MARGIN
+PREVIEW_BOX1_RECT = pygame.Rect(
+    PREVIEW_X, PREVIEW_MARGIN, PREVIEW_BOX_WIDTH, PREVIEW_BOX_HEIGHT)
+PREVIEW_BOX2_RECT = pygame.Rect(
+    PREVIEW_X, PREVIEW_MARGIN + PREVIEW_BOX_HEIGHT + PREVIEW_MARGIN,
+    PREVIEW_BOX_WIDTH, PREVIEW_BOX_HEIGHT)
+PREVIEW_OUTLINE_RECT = pygame.Rect(
+    PREVIEW_X, PREVIEW_MARGIN, PREVIEW_BOX_WIDTH, PREVIEW_BOX_HEIGHT * 2 + PREVIEW_MARGIN)
+STAGE_BORDER_RECT = pygame.Rect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+HUD_AREA_RECT = pygame.Rect(WINDOW_WIDTH, 0, WINDOW_WIDTH_EXTENDED - WINDOW_WIDTH, WINDOW_HEIGHT)
+FULL_WINDOW_RECT = pygame.Rect(0, 0, WINDOW_WIDTH_EXTENDED, WINDOW_HEIGHT)
+
 # Falling speed (in milliseconds)
 INITIAL_FALL_DELAY: int = 800  # Initial falling delay for Stage 1 (ms)
 MIN_FALL_DELAY: int = 100      # Minimum falling delay (ms)
@@ -91,6 +116,68 @@ shapes: List[Tuple[str, List[Tuple[int, int]], Tuple[int, int, int]]] = [
 # Base weights for appearance
 base_shape_weights: List[int] = [15, 5, 15, 15, 15, 5]
 
+# Cell colors by palette index; grid cells store an index into this tuple
+# (0 = empty) instead of a color tuple, so the color grid holds small
+# shared ints rather than per-cell tuple references.
+PALETTE: Tuple[Optional[Tuple[int, int, int]], ...] = \
+    (None,) + tuple(color for _, _, color in shapes)
+COLOR_INDEX: dict = {color: i for i, color in enumerate(PALETTE) if color is not None}
+
+@functools.lru_cache(maxsize=None)
+def _cum_weights_for_stage(stage: int) -> Tuple[int, ...]:
+    """
+    Cumulative effective shape weights for a stage (common shapes get
+    rarer, floor 5). Precomputed so random.choices can skip its internal
+    accumulation pass on every bag refill.
+
+    Args:
+        stage (int): The current stage number.
+
+    Returns:
+        Tuple[int, ...]: Running totals, one per entry in shapes.
+    """
+    return tuple(itertools.accumulate(
+        max(w - (stage - 1), 5) for w in base_shape_weights))
+
+# Number of shapes drawn per bag refill; amortizes the cumulative-weight
+# setup that random.choices repeats on every call.
+PIECE_BAG_SIZE: int = 64
+
+# A rotation state as a flat tuple (bx0, by0, bx1, by1, bx2, by2); flat int
+# tuples avoid allocating three inner pair tuples per state access.
+BlockTuple = Tuple[int, ...]
+
+def _block_pairs(blocks: BlockTuple):
+    """Iterate a flat block tuple as (bx, by) pairs."""
+    return zip(blocks[::2], blocks[1::2])
+
+def _compute_rotations(blocks: List[Tuple[int, int]]) -> Tuple[BlockTuple, ...]:
+    """
+    Enumerate the distinct rotation states of a shape (90° clockwise steps).
+
+    Args:
+        blocks (List[Tuple[int, int]]): The shape's base relative positions.
+
+    Returns:
+        Tuple[BlockTuple, ...]: The distinct rotation states as flat tuples,
+        in rotation order.
+    """
+    rotations: List[BlockTuple] = []
+    seen: set = set()
+    current: List[Tuple[int, int]] = list(blocks)
+    for _ in range(4):
+        key = frozenset(current)
+        if key in seen:
+            break
+        seen.add(key)
+        rotations.append(tuple(coord for pair in current for coord in pair))
+        current = [(by, -bx) for (bx, by) in current]
+    return tuple(rotations)
+
+# All rotation states per shape, computed once at import (symmetric shapes
+# such as "I" and "slash" collapse to 2 states).
+ROTATIONS: dict = {name: _compute_rotations(blocks) for name, blocks, _ in shapes}
+
 # --- Piece Class ---
 class Piece:
     """
@@ -98,107 +185,282 @@ class Piece:
 
     Attributes:
         name (str): The name of the piece.
-        blocks (List[Tuple[int, int]]): The relative positions of the blocks.
+        rot_index (int): Index into ROTATIONS[name] for the current rotation.
+        blocks (BlockTuple): The relative block positions as a flat
+            (bx0, by0, bx1, by1, bx2, by2) tuple (shared, precomputed).
         color (Tuple[int, int, int]): The color of the piece.
         x (int): The x-coordinate of the pivot on the grid.
         y (int): The y-coordinate of the pivot on the grid.
     """
     def __init__(self, shape: Tuple[str, List[Tuple[int, int]], Tuple[int, int, int]], grid_x: int, grid_y: int) -> None:
         self.name: str = shape[0]
-        self.blocks: List[Tuple[int, int]] = shape[1][:]
+        self.rot_index: int = 0
+        self.blocks: BlockTuple = ROTATIONS[self.name][0]
         self.color: Tuple[int, int, int] = shape[2]
         self.x: int = grid_x
         self.y: int = grid_y
+        self._abs: Optional[Tuple[Tuple[int, int], ...]] = None  # Cached absolute positions
 
-    def get_block_positions(self) -> List[Tuple[int, int]]:
+    def get_block_positions(self) -> Tuple[Tuple[int, int], ...]:
         """
         Get the absolute positions of the piece's blocks on the grid.
 
         Returns:
-            List[Tuple[int, int]]: A list of (x, y) positions.
+            Tuple[Tuple[int, int], ...]: The three (x, y) positions.
+        """
+        positions = self._abs
+        if positions is None:
+            b = self.blocks
+            x, y = self.x, self.y
+            positions = self._abs = \
+                ((x + b[0], y + b[1]), (x + b[2], y + b[3]), (x + b[4], y + b[5]))
+        return positions
+
+    def move(self, dx: int, dy: int) -> None:
+        """
+        Shift the pivot and invalidate the cached absolute positions.
+
+        Args:
+            dx (int): Horizontal offset in cells.
+            dy (int): Vertical offset in cells.
+        """
+        self.x += dx
+        self.y += dy
+        self._abs = None
+
+    def set_position(self, x: int, y: int) -> None:
+        """
+        Place the pivot and invalidate the cached absolute positions.
+
+        Args:
+            x (int): The new pivot x-coordinate.
+            y (int): The new pivot y-coordinate.
         """
-        return [(self.x + bx, self.y + by) for (bx, by) in self.blocks]
+        self.x = x
+        self.y = y
+        self._abs = None
 
-    def rotate(self) -> List[Tuple[int, int]]:
+    def rotate(self) -> BlockTuple:
         """
-        Compute the new relative block positions after a 90° clockwise rotation.
+        Look up the relative block positions after a 90° clockwise rotation.
 
         Returns:
-            List[Tuple[int, int]]: The new relative positions.
+            BlockTuple: The precomputed next rotation state.
         """
-        return [(by, -bx) for (bx, by) in self.blocks]
+        rotations = ROTATIONS[self.name]
+        return rotations[(self.rot_index + 1) % len(rotations)]
 
-    def apply_rotation(self, new_blocks: List[Tuple[int, int]]) -> None:
+    def apply_rotation(self, new_blocks: BlockTuple) -> None:
         """
-        Update the piece's block positions after rotation.
+        Advance the piece to its next rotation state.
 
         Args:
-            new_blocks (List[Tuple[int, int]]): The new relative positions.
+            new_blocks (BlockTuple): The new relative positions (from rotate()).
         """
-        self.blocks = new_blocks
+        rotations = ROTATIONS[self.name]
+        self.rot_index = (self.rot_index + 1) % len(rotations)
+        self.blocks = rotations[self.rot_index]
+        self._abs = None
 
 # --- Grid Functions ---
-def create_grid() -> List[List[Optional[Tuple[int, int, int]]]]:
+FULL_ROW_MASK: int = (1 << GRID_WIDTH) - 1  # All bits set = full row
+
+class Grid:
     """
-    Initialize the game grid.
+    The game field, storing per-cell palette indices for rendering
+    alongside a bitboard occupancy (one int of GRID_WIDTH bits per row) so
+    that collision tests and full-row detection are single int operations.
 
-    Returns:
-        List[List[Optional[Tuple[int, int, int]]]]: A 2D grid where each cell is either a color tuple or None.
+    Attributes:
+        colors (List[bytearray]): Per-cell PALETTE indices (0 = empty), one byte row per grid row.
+        rows (bytearray): Per-row occupancy bitmasks; bit x is set iff cell (x, y) is filled.
+        top_filled (List[Optional[int]]): Topmost visible filled row per column
+            (None = column empty in the visible area), maintained incrementally.
+        col_top (List[int]): Topmost filled row per column over all rows,
+            GRID_HEIGHT when the column is empty; used for hard-drop distance.
     """
-    return [[None for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
+    def __init__(self) -> None:
+        self.colors: List[bytearray] = [bytearray(GRID_WIDTH) for _ in range(GRID_HEIGHT)]
+        # GRID_WIDTH is 8, so each row's mask fits a byte; a bytearray keeps
+        # the whole occupancy in 22 contiguous bytes.
+        self.rows: bytearray = bytearray(GRID_HEIGHT)
+        self.top_filled: List[Optional[int]] = [None] * GRID_WIDTH
+        self.col_top: List[int] = [GRID_HEIGHT] * GRID_WIDTH
+        self.dirty: bool = True  # True when the cached grid surface needs a rebuild
+
+    def recompute_top_filled(self) -> None:
+        """
+        Rebuild top_filled and col_top from the occupancy rows (used after
+        line clears; piece locks update them incrementally instead).
+        """
+        rows = self.rows
+        for x in range(GRID_WIDTH):
+            bit = 1 << x
+            self.top_filled[x] = next(
+                (y for y in range(VISIBLE_ROW_OFFSET, GRID_HEIGHT) if rows[y] & bit), None)
+            self.col_top[x] = next(
+                (y for y in range(GRID_HEIGHT) if rows[y] & bit), GRID_HEIGHT)
 
-def valid_position(piece: Piece, grid: List[List[Optional[Tuple[int, int, int]]]],
-                   block_positions: Optional[List[Tuple[int, int]]] = None) -> bool:
+def create_grid() -> Grid:
     """
-    Check if the piece's block positions are valid (inside the grid and on empty cells).
+    Initialize the game grid.
+
+    Returns:
+        Grid: An empty game grid.
+    """
+    return Grid()
+
+# Cache of per-shape row masks keyed by the piece's relative block tuple:
+# (x_min, x_max, shift_offset, ((dy, mask), ...)). The pivot x must lie in
+# [x_min, x_max] for all blocks to be inside the walls; each mask is the
+# row's occupied bits shifted so that `mask << (x + shift_offset)` places
+# them at their absolute columns.
+_piece_mask_cache: dict = {}
+
+def _piece_row_masks(blocks_key: Tuple[Tuple[int, int], ...]) -> Tuple[int, int, int, Tuple[Tuple[int, int], ...]]:
+    entry = _piece_mask_cache.get(blocks_key)
+    if entry is None:
+        min_bx = min(blocks_key[::2])
+        max_bx = max(blocks_key[::2])
+        masks_by_dy: dict = {}
+        for bx, by in _block_pairs(blocks_key):
+            masks_by_dy[by] = masks_by_dy.get(by, 0) | (1 << (bx - min_bx))
+        entry = (-min_bx, GRID_WIDTH - 1 - max_bx, min_bx, tuple(sorted(masks_by_dy.items())))
+        _piece_mask_cache[blocks_key] = entry
+    return entry
+
+# Per-rotation bottom block per occupied column: ((bx, max_by), ...),
+# keyed like _piece_mask_cache. Used for O(columns) hard-drop distance.
+_piece_bottom_cache: dict = {}
+
+def _piece_column_bottoms(blocks_key: BlockTuple) -> Tuple[Tuple[int, int], ...]:
+    entry = _piece_bottom_cache.get(blocks_key)
+    if entry is None:
+        bottoms: dict = {}
+        for bx, by in _block_pairs(blocks_key):
+            if bx not in bottoms or by > bottoms[bx]:
+                bottoms[bx] = by
+        entry = tuple(bottoms.items())
+        _piece_bottom_cache[blocks_key] = entry
+    return entry
+
+# Pre-warm the caches for every rotation state so the hot path never has
+# to build an entry.
+for _rotations in ROTATIONS.values():
+    for _blocks in _rotations:
+        _piece_row_masks(_blocks)
+        _piece_column_bottoms(_blocks)
+
+def hard_drop_distance(piece: Piece, grid: Grid) -> int:
+    """
+    Compute how many rows the piece can fall before resting.
+
+    The common case is answered in O(columns) from the cached per-column
+    occupancy tops; when the piece sits below an overhang (a column whose
+    topmost block is at or above the piece), fall back to stepwise
+    valid_position checks.
+
+    Args:
+        piece (Piece): The falling piece (assumed to be in a valid position).
+        grid (Grid): The game grid.
+
+    Returns:
+        int: The drop distance in rows (0 if already resting).
+    """
+    col_top = grid.col_top
+    candidates: List[int] = []
+    for bx, bottom_by in _piece_column_bottoms(piece.blocks):
+        x = piece.x + bx
+        cell_y = piece.y + bottom_by
+        if col_top[x] <= cell_y:
+            break  # Overhang above the piece; the height table is not enough
+        candidates.append(col_top[x] - cell_y - 1)
+    else:
+        return min(candidates)
+    distance = 0
+    while True:
+        if not valid_position(piece, grid, dy=distance + 1):
+            return distance
+        distance += 1
+
+def valid_position(piece: Piece, grid: Grid, dx: int = 0, dy: int = 0,
+                   blocks: Optional[BlockTuple] = None) -> bool:
+    """
+    Check if the piece fits at its pivot offset by (dx, dy), optionally with
+    a different rotation state, inside the grid and on empty cells.
     Cells with negative y-values (above the visible area) are ignored.
 
     Args:
         piece (Piece): The piece to check.
-        grid (List[List[Optional[Tuple[int, int, int]]]]): The game grid.
-        block_positions (Optional[List[Tuple[int, int]]]): Optional positions to check.
+        grid (Grid): The game grid.
+        dx (int): Horizontal offset from the piece's pivot.
+        dy (int): Vertical offset from the piece's pivot.
+        blocks (Optional[BlockTuple]): Alternative rotation state to test.
 
     Returns:
         bool: True if valid, False otherwise.
     """
-    if block_positions is None:
-        block_positions = piece.get_block_positions()
-    for (x, y) in block_positions:
-        if x < 0 or x >= GRID_WIDTH:
+    x_min, x_max, shift_offset, mask_rows = \
+        _piece_row_masks(blocks if blocks is not None else piece.blocks)
+    x = piece.x + dx
+    if x < x_min or x > x_max:
+        return False
+    y = piece.y + dy
+    # Bind globals to locals: this loop is the interpreter's hot path.
+    rows = grid.rows
+    grid_height = GRID_HEIGHT
+    shift = x + shift_offset
+    for row_dy, mask in mask_rows:
+        ny = y + row_dy
+        if ny >= grid_height:
             return False
-        if y >= GRID_HEIGHT:
-            return False
-        if y >= 0 and grid[y][x] is not None:
+        if ny >= 0 and rows[ny] & (mask << shift):
             return False
     return True
 
-def add_piece_to_grid(piece: Piece, grid: List[List[Optional[Tuple[int, int, int]]]]) -> None:
+def add_piece_to_grid(piece: Piece, grid: Grid) -> None:
     """
     Fix the piece onto the grid.
 
     Args:
         piece (Piece): The piece to add.
-        grid (List[List[Optional[Tuple[int, int, int]]]]): The game grid.
+        grid (Grid): The game grid.
     """
+    top_filled = grid.top_filled
+    col_top = grid.col_top
     for (x, y) in piece.get_block_positions():
         if y >= 0:
-            grid[y][x] = piece.color
+            grid.colors[y][x] = COLOR_INDEX[piece.color]
+            grid.rows[y] |= 1 << x
+            if y >= VISIBLE_ROW_OFFSET and (top_filled[x] is None or y < top_filled[x]):
+                top_filled[x] = y
+            if y < col_top[x]:
+                col_top[x] = y
+    grid.dirty = True
 
-def clear_full_lines(grid: List[List[Optional[Tuple[int, int, int]]]]) -> Tuple[List[List[Optional[Tuple[int, int, int]]]], int]:
+def clear_full_lines(grid: Grid) -> Tuple[Grid, int]:
     """
     Remove full lines from the grid.
 
     Args:
-        grid (List[List[Optional[Tuple[int, int, int]]]]): The current grid.
+        grid (Grid): The current grid.
 
     Returns:
-        Tuple[List[List[Optional[Tuple[int, int, int]]]], int]: A tuple with the new grid and the number of cleared lines.
-    """
-    new_grid = [row for row in grid if None in row]
-    num_cleared = len(grid) - len(new_grid)
-    for _ in range(num_cleared):
-        new_grid.insert(0, [None for _ in range(GRID_WIDTH)])
-    return new_grid, num_cleared
+        Tuple[Grid, int]: A tuple with the updated grid and the number of cleared lines.
+    """
+    rows = grid.rows
+    # Fast path: most locks clear nothing, and the `in` scan over 22 ints
+    # runs entirely in C, so skip the row rebuild in the common case.
+    if FULL_ROW_MASK not in rows:
+        return grid, 0
+    kept = [y for y in range(GRID_HEIGHT) if rows[y] != FULL_ROW_MASK]
+    num_cleared = GRID_HEIGHT - len(kept)
+    grid.colors = [bytearray(GRID_WIDTH) for _ in range(num_cleared)] + \
+                  [grid.colors[y] for y in kept]
+    grid.rows = bytearray(num_cleared) + bytearray(rows[y] for y in kept)
+    grid.recompute_top_filled()
+    grid.dirty = True
+    return grid, num_cleared
 
 # --- Game State Enum ---
 class GameState(Enum):
@@ -207,60 +469,112 @@ class GameState(Enum):
     STAGE_CLEAR = 3   # Stage clear pause (waiting for any key)
     GAME_OVER = 4     # Game over state
 
-# --- Game Context Class ---
-class GameContext:
-    """
-    Holds all game state data.
-    """
-    def __init__(self) -> None:
-        self.grid: List[List[Optional[Tuple[int, int, int]]]] = create_grid()
-        self.stage: int = 1
-        self.stage_threshold: int = self.stage * STAGE_CLEAR_FACTOR
-        self.lines_cleared_stage: int = 0
-        self.fall_delay: int = get_initial_fall_delay(self.stage)
-        self.score: int = 0
-        self.combo_multiplier: int = 1
-        self.state: GameState = GameState.RUNNING
-        self.close_request: bool = False
-        # Initialize preview pieces using effective weights
-        effective_weights: List[int] = [max(w - (self.stage - 1), 5) for w in base_shape_weights]
-        self.next_piece: Piece = Piece(random.choices(shapes, weights=effective_weights, k=1)[0], GRID_WIDTH // 2, 1)
-        self.next_next_piece: Piece = Piece(random.choices(shapes, weights=effective_weights, k=1)[0], GRID_WIDTH // 2, 1)
-        self.current_piece: Piece = self.next_piece
-        self.current_piece.x = GRID_WIDTH // 2
-        self.current_piece.y = 1
-        self.next_piece = self.next_next_piece
-        self.next_next_piece = Piece(random.choices(shapes, weights=effective_weights, k=1)[0], GRID_WIDTH // 2, 1)
-
 # --- Drawing Functions ---
-def draw_grid(surface: pygame.Surface, grid: List[List[Optional[Tuple[int, int, int]]]], 
-              falling_columns: Optional[set[int]] = None) -> None:
+# Cell surfaces with the 1-px border baked in, built once per
+# (fill color, border color) pair and blitted instead of paired
+# pygame.draw.rect calls.
+_block_surfaces: dict = {}
+
+def _convert_to_display(surf: pygame.Surface) -> pygame.Surface:
+    """Match the display pixel format so blits skip per-pixel conversion."""
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return surf.convert()
+    return surf
+
+def _convert_all_cached_surfaces() -> None:
+    """
+    Re-convert any cached surfaces built before the display existed.
+    Called once from main() right after pygame.display.set_mode().
+    """
+    for key, surf in _block_surfaces.items():
+        _block_surfaces[key] = _convert_to_display(surf)
+    _render_info_text.cache_clear()
+    _render_pause_line.cache_clear()
+    _preview_thumbs.clear()
+    global _grid_background
+    _grid_background = None
+
+def _get_block_surface(color: Tuple[int, int, int],
+                       border_color: Tuple[int, int, int] = PIECE_BORDER_COLOR) -> pygame.Surface:
+    key = (color, border_color)
+    surf = _block_surfaces.get(key)
+    if surf is None:
+        surf = pygame.Surface((BLOCK_SIZE, BLOCK_SIZE))
+        surf.fill(color)
+        pygame.draw.rect(surf, border_color, surf.get_rect(), 1)
+        surf = _convert_to_display(surf)
+        _block_surfaces[key] = surf
+    return surf
+
+# The empty field (background cells with grid lines) never changes; it is
+# composited once and used as the base layer of every grid rebuild.
+_grid_background: Optional[pygame.Surface] = None
+
+def _get_grid_background() -> pygame.Surface:
+    global _grid_background
+    if _grid_background is None:
+        bg = _convert_to_display(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)))
+        bg_cell = _get_block_surface(BG_COLOR, GRID_LINE_COLOR)
+        bg.blits([(bg_cell, (COL_PX[x], ROW_PX[y]))
+                  for y in range(VISIBLE_ROW_OFFSET, GRID_HEIGHT)
+                  for x in range(GRID_WIDTH)], doreturn=0)
+        _grid_background = bg
+    return _grid_background
+
+def rebuild_grid_surface(ctx: "GameContext") -> None:
+    """
+    Redraw the fixed-block layer into the cached offscreen surface.
+    For each column, find the topmost fixed cell (within the visible area);
+    empty cells below (or equal to) that cell are filled with GAP_FILL_COLOR.
+    Grid lines are drawn over the cells. Called only when the grid changes.
+
+    Args:
+        ctx (GameContext): The game context.
     """
-    Draw the game grid along with fixed blocks.
-    For each column, find the topmost fixed cell (within the visible area).
-    Then, for each empty cell:
-      - If below (or equal to) that cell, fill with GAP_FILL_COLOR.
-      - Else if the column is in falling_columns, fill with FALLING_COLUMN_COLOR.
-    Draw grid lines over the cells.
-    """
-    top_filled_by_column: List[Optional[int]] = [None] * GRID_WIDTH
-    for x in range(GRID_WIDTH):
-        for y in range(VISIBLE_ROW_OFFSET, GRID_HEIGHT):
-            if grid[y][x] is not None:
-                top_filled_by_column[x] = y
-                break
+    if ctx.grid_surface is None:
+        ctx.grid_surface = _convert_to_display(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)))
+    surface = ctx.grid_surface
+    colors = ctx.grid.colors
+    top_filled_by_column = ctx.grid.top_filled
 
+    surface.blit(_get_grid_background(), (0, 0))
+    gap_cell = _get_block_surface(GAP_FILL_COLOR, GRID_LINE_COLOR)
+    blit_list = []
+    append = blit_list.append
     for y in range(VISIBLE_ROW_OFFSET, GRID_HEIGHT):
+        py = ROW_PX[y]
+        row_colors = colors[y]
         for x in range(GRID_WIDTH):
-            rect = pygame.Rect(x * BLOCK_SIZE, (y - VISIBLE_ROW_OFFSET) * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE)
-            if grid[y][x] is not None:
-                pygame.draw.rect(surface, grid[y][x], rect)
-            else:
-                if top_filled_by_column[x] is not None and y >= top_filled_by_column[x]:
-                    pygame.draw.rect(surface, GAP_FILL_COLOR, rect)
-                elif falling_columns is not None and x in falling_columns:
-                    pygame.draw.rect(surface, FALLING_COLUMN_COLOR, rect)
-            pygame.draw.rect(surface, GRID_LINE_COLOR, rect, 1)
+            if row_colors[x]:
+                append((_get_block_surface(PALETTE[row_colors[x]], GRID_LINE_COLOR),
+                        (COL_PX[x], py)))
+            elif top_filled_by_column[x] is not None and y >= top_filled_by_column[x]:
+                append((gap_cell, (COL_PX[x], py)))
+    # One batched call keeps the per-cell loop in C; empty cells are
+    # already part of the pre-rendered background.
+    surface.blits(blit_list, doreturn=0)
+    ctx.grid.dirty = False
+
+def draw_grid(surface: pygame.Surface, ctx: "GameContext",
+              falling_columns: Optional[set[int]] = None) -> None:
+    """
+    Draw the game grid along with fixed blocks.
+    The fixed-block layer (blocks, gap fill, grid lines) is blitted from a
+    cached surface that is rebuilt only when the grid changes; only the
+    falling-column highlight is painted per frame, restricted to the (at
+    most three) columns occupied by the active piece.
+    """
+    if ctx.grid_surface is None or ctx.grid.dirty:
+        rebuild_grid_surface(ctx)
+    surface.blit(ctx.grid_surface, (0, 0))
+    if falling_columns:
+        top_filled = ctx.grid.top_filled
+        cell = _get_block_surface(FALLING_COLUMN_COLOR, GRID_LINE_COLOR)
+        blit_list = [(cell, (COL_PX[x], ROW_PX[y]))
+                     for x in falling_columns
+                     for y in range(VISIBLE_ROW_OFFSET,
+                                    top_filled[x] if top_filled[x] is not None else GRID_HEIGHT)]
+        surface.blits(blit_list, doreturn=0)
 
 def draw_piece(surface: pygame.Surface, piece: Piece) -> None:
     """
@@ -270,11 +584,10 @@ def draw_piece(surface: pygame.Surface, piece: Piece) -> None:
         surface (pygame.Surface): The drawing surface.
         piece (Piece): The active piece.
     """
+    cell = _get_block_surface(piece.color)
     for (x, y) in piece.get_block_positions():
         if y >= VISIBLE_ROW_OFFSET:
-            rect = pygame.Rect(x * BLOCK_SIZE, (y - VISIBLE_ROW_OFFSET) * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE)
-            pygame.draw.rect(surface, piece.color, rect)
-            pygame.draw.rect(surface, PIECE_BORDER_COLOR, rect, 1)
+            surface.blit(cell, (COL_PX[x], ROW_PX[y]))
 
 def draw_stage_border(surface: pygame.Surface) -> None:
     """
@@ -283,13 +596,29 @@ def draw_stage_border(surface: pygame.Surface) -> None:
     Args:
         surface (pygame.Surface): The drawing surface.
     """
-    border_rect = pygame.Rect(0, 0, GRID_WIDTH * BLOCK_SIZE, (GRID_HEIGHT - VISIBLE_ROW_OFFSET) * BLOCK_SIZE)
-    pygame.draw.rect(surface, STAGE_BORDER_COLOR, border_rect, 2)
+    pygame.draw.rect(surface, STAGE_BORDER_COLOR, STAGE_BORDER_RECT, 2)
+
+# Preview thumbnails (one per shape, spawn orientation), composited once
+# and blitted whole instead of per-block each frame. Blocks span at most
+# [-1, 1] around the pivot, so a 3x3-cell canvas fits every shape.
+_preview_thumbs: dict = {}
+
+def _get_preview_thumb(piece: Piece) -> pygame.Surface:
+    thumb = _preview_thumbs.get(piece.name)
+    if thumb is None:
+        thumb = pygame.Surface((3 * BLOCK_SIZE, 3 * BLOCK_SIZE), pygame.SRCALPHA)
+        cell = _get_block_surface(piece.color)
+        for (bx, by) in _block_pairs(ROTATIONS[piece.name][0]):
+            thumb.blit(cell, ((1 + bx) * BLOCK_SIZE, (1 + by) * BLOCK_SIZE))
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            thumb = thumb.convert_alpha()
+        _preview_thumbs[piece.name] = thumb
+    return thumb
 
 def draw_preview_box(surface: pygame.Surface, piece: Piece, box_rect: pygame.Rect) -> None:
     """
     Draw a preview of a piece within a specified rectangle.
-    
+
     Args:
         surface (pygame.Surface): The drawing surface.
         piece (Piece): The piece to preview.
@@ -297,12 +626,10 @@ def draw_preview_box(surface: pygame.Surface, piece: Piece, box_rect: pygame.Rec
     """
     center_x = box_rect.x + box_rect.width // 2
     center_y = box_rect.y + box_rect.height // 2
-    for (bx, by) in piece.blocks:
-        block_x = center_x + bx * BLOCK_SIZE - BLOCK_SIZE // 2
-        block_y = center_y + by * BLOCK_SIZE - BLOCK_SIZE // 2
-        block_rect = pygame.Rect(block_x, block_y, BLOCK_SIZE, BLOCK_SIZE)
-        pygame.draw.rect(surface, piece.color, block_rect)
-        pygame.draw.rect(surface, PIECE_BORDER_COLOR, block_rect, 1)
+    thumb = _get_preview_thumb(piece)
+    # The thumbnail's pivot cell sits one cell in from its top-left corner.
+    surface.blit(thumb, (center_x - BLOCK_SIZE - BLOCK_SIZE // 2,
+                         center_y - BLOCK_SIZE - BLOCK_SIZE // 2))
 
 def draw_previews(surface: pygame.Surface, next_piece: Piece, next_next_piece: Piece) -> None:
     """
@@ -313,29 +640,58 @@ def draw_previews(surface: pygame.Surface, next_piece: Piece, next_next_piece: P
         next_piece (Piece): The next piece.
         next_next_piece (Piece): The piece following the next.
     """
-    preview_x = WINDOW_WIDTH + PREVIEW_MARGIN
-    box1_rect = pygame.Rect(preview_x, PREVIEW_MARGIN, PREVIEW_BOX_WIDTH, PREVIEW_BOX_HEIGHT)
-    draw_preview_box(surface, next_next_piece, box1_rect)
-    box2_rect = pygame.Rect(preview_x, PREVIEW_MARGIN + PREVIEW_BOX_HEIGHT + PREVIEW_MARGIN, PREVIEW_BOX_WIDTH, PREVIEW_BOX_HEIGHT)
-    draw_preview_box(surface, next_piece, box2_rect)
-    box_rect = pygame.Rect(preview_x, PREVIEW_MARGIN, PREVIEW_BOX_WIDTH, PREVIEW_BOX_HEIGHT * 2 + PREVIEW_MARGIN)
-    pygame.draw.rect(surface, STAGE_BORDER_COLOR, box_rect, 2)
+    draw_preview_box(surface, next_next_piece, PREVIEW_BOX1_RECT)
+    draw_preview_box(surface, next_piece, PREVIEW_BOX2_RECT)
+    pygame.draw.rect(surface, STAGE_BORDER_COLOR, PREVIEW_OUTLINE_RECT, 2)
+
+# Fonts are constructed once on first use (after pygame.init()) and the
+# rendered info lines are memoized: score/stage/lines change only on line
+# clears, so re-rasterizing them every frame is wasted work.
+_info_font: Optional[pygame.font.Font] = None
+_pause_font: Optional[pygame.font.Font] = None
+
+def _get_info_font() -> pygame.font.Font:
+    global _info_font
+    if _info_font is None:
+        # Font(None, ...) loads the bundled default font directly and skips
+        # the system font enumeration SysFont performs.
+        _info_font = pygame.font.Font(None, 36)
+    return _info_font
+
+def _get_pause_font() -> pygame.font.Font:
+    global _pause_font
+    if _pause_font is None:
+        _pause_font = pygame.font.Font(None, 42)
+    return _pause_font
+
+@functools.lru_cache(maxsize=256)
+def _render_info_text(text: str) -> pygame.Surface:
+    surf = _get_info_font().render(text, True, TEXT_COLOR)
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        surf = surf.convert_alpha()
+    return surf
+
+@functools.lru_cache(maxsize=32)
+def _render_pause_line(line: str) -> pygame.Surface:
+    surf = _get_pause_font().render(line, True, TEXT_COLOR)
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        surf = surf.convert_alpha()
+    return surf
 
 def draw_info(surface: pygame.Surface, score: int, stage: int, lines_to_clear: int) -> None:
     """
     Draw game information (score, stage, and lines remaining) on the right side.
-    
+
     Args:
         surface (pygame.Surface): The drawing surface.
         score (int): The current score.
         stage (int): The current stage.
         lines_to_clear (int): The number of lines remaining for stage advancement.
     """
-    font = pygame.font.SysFont(None, 36)
-    text_score = font.render("Score: " + str(score), True, TEXT_COLOR)
-    text_stage = font.render("Stage: " + str(stage), True, TEXT_COLOR)
-    text_remaining = font.render("Lines remaining: " + str(lines_to_clear), True, TEXT_COLOR)
-    text_x = WINDOW_WIDTH + PREVIEW_MARGIN
+    text_score = _render_info_text(f"Score: {score}")
+    text_stage = _render_info_text(f"Stage: {stage}")
+    text_remaining = _render_info_text(f"Lines remaining: {lines_to_clear}")
+    text_x = PREVIEW_X
     text_y = PREVIEW_MARGIN + 2 * (PREVIEW_BOX_HEIGHT + PREVIEW_MARGIN)
     surface.blit(text_score, (text_x, text_y))
     surface.blit(text_stage, (text_x, text_y + 40))
@@ -344,21 +700,19 @@ def draw_info(surface: pygame.Surface, score: int, stage: int, lines_to_clear: i
 def draw_pause_message(surface: pygame.Surface, message: str = "Paused") -> None:
     """
     Draw a multi-line message at the center of the screen.
-    
+
     Args:
         surface (pygame.Surface): The drawing surface.
         message (str): The message to display (use '\n' for line breaks).
     """
-    font = pygame.font.SysFont(None, 42)
-    lines = message.split("\n")
-    line_heights = [font.size(line)[1] for line in lines]
-    total_height = sum(line_heights)
+    text_surfaces = [_render_pause_line(line) for line in message.split("\n")]
+    total_height = sum(s.get_height() for s in text_surfaces)
     current_y = (WINDOW_HEIGHT - total_height) // 2
-    for i, line in enumerate(lines):
-        text_surface = font.render(line, True, TEXT_COLOR)
-        text_rect = text_surface.get_rect(center=(WINDOW_WIDTH // 2, current_y + line_heights[i] // 2))
+    for text_surface in text_surfaces:
+        line_height = text_surface.get_height()
+        text_rect = text_surface.get_rect(center=(WINDOW_WIDTH // 2, current_y + line_height // 2))
         surface.blit(text_surface, text_rect)
-        current_y += line_heights[i]
+        current_y += line_height
 
 # --- Main Game Loop Functions ---
 class GameContext:
@@ -366,31 +720,123 @@ class GameContext:
     Encapsulates the overall game state.
     """
     def __init__(self) -> None:
-        self.grid: List[List[Optional[Tuple[int, int, int]]]] = create_grid()
+        self.grid: Grid = create_grid()
+        self.grid_surface: Optional[pygame.Surface] = None  # Cached fixed-block layer
+        self.dirty: bool = True  # True when something visible changed since the last render
+        self.dirty_rects: List[pygame.Rect] = []  # Changed regions; empty = full flip
+        self.hud_dirty: bool = True  # True when the preview/info area needs repainting
         self.stage: int = 1
         self.stage_threshold: int = self.stage * STAGE_CLEAR_FACTOR
         self.lines_cleared_stage: int = 0
         self.fall_delay: int = get_initial_fall_delay(self.stage)
+        self.last_fall_ms: int = pygame.time.get_ticks()  # Time of the last gravity step
         self.score: int = 0
         self.combo_multiplier: int = 1
         self.state: GameState = GameState.RUNNING
         self.close_request: bool = False
-        effective_weights: List[int] = [max(w - (self.stage - 1), 5) for w in base_shape_weights]
-        self.next_piece: Piece = Piece(random.choices(shapes, weights=effective_weights, k=1)[0], GRID_WIDTH // 2, 1)
-        self.next_next_piece: Piece = Piece(random.choices(shapes, weights=effective_weights, k=1)[0], GRID_WIDTH // 2, 1)
-        self.current_piece: Piece = self.next_piece
-        self.current_piece.x = GRID_WIDTH // 2
-        self.current_piece.y = 1
-        self.next_piece = self.next_next_piece
-        self.next_next_piece = Piece(random.choices(shapes, weights=effective_weights, k=1)[0], GRID_WIDTH // 2, 1)
+        self.piece_bag: collections.deque = collections.deque()
+        self.piece_bag_stage: int = 0  # Stage the bag was filled for (0 = not filled yet)
+        self.current_piece: Piece = spawn_piece(self)
+        self.next_piece: Piece = spawn_piece(self)
+        self.next_next_piece: Piece = spawn_piece(self)
+
+def mark_piece_columns_dirty(ctx: GameContext) -> None:
+    """
+    Mark the columns currently occupied by the active piece as needing a
+    display update. Whole columns are used because the falling-column
+    highlight spans the field height.
+
+    Args:
+        ctx (GameContext): The game context.
+    """
+    piece = ctx.current_piece
+    b = piece.blocks
+    min_bx = min(b[0], b[2], b[4])
+    max_bx = max(b[0], b[2], b[4])
+    rect = pygame.Rect(
+        COL_PX[piece.x + min_bx], 0,
+        (max_bx - min_bx + 1) * BLOCK_SIZE, WINDOW_HEIGHT)
+    # Key repeat can fire several moves between renders; identical or
+    # contained column spans coalesce into the pending rect instead of
+    # queueing duplicate display updates.
+    if not (ctx.dirty_rects and ctx.dirty_rects[-1].contains(rect)):
+        ctx.dirty_rects.append(rect)
+
+def mark_all_dirty(ctx: GameContext) -> None:
+    """
+    Mark the whole window as needing a display update (locks, line clears,
+    and state transitions can touch the HUD and preview area too).
+
+    Args:
+        ctx (GameContext): The game context.
+    """
+    ctx.dirty_rects.clear()
+    ctx.dirty_rects.append(FULL_WINDOW_RECT)
+    ctx.hud_dirty = True
+
+def spawn_piece(ctx: GameContext) -> Piece:
+    """
+    Draw the next piece from the batched bag, refilling it when empty or
+    when the stage (and thus the shape weights) has changed.
+
+    Args:
+        ctx (GameContext): The game context.
+
+    Returns:
+        Piece: A new piece at the spawn position.
+    """
+    if not ctx.piece_bag or ctx.piece_bag_stage != ctx.stage:
+        ctx.piece_bag.clear()
+        cum_weights = _cum_weights_for_stage(ctx.stage)
+        ctx.piece_bag.extend(random.choices(shapes, cum_weights=cum_weights, k=PIECE_BAG_SIZE))
+        ctx.piece_bag_stage = ctx.stage
+    return Piece(ctx.piece_bag.popleft(), GRID_WIDTH // 2, 1)
+
+def lock_and_spawn(ctx: GameContext) -> None:
+    """
+    Fix the active piece onto the grid, clear full lines, update score,
+    combo, and stage progression, and spawn the next piece. Shared by the
+    hard-drop handler and the gravity step.
 
-def handle_events(ctx: GameContext, fall_event: int) -> None:
+    Args:
+        ctx (GameContext): The game context.
+    """
+    add_piece_to_grid(ctx.current_piece, ctx.grid)
+    new_grid, lines_cleared = clear_full_lines(ctx.grid)
+    ctx.grid = new_grid
+    if lines_cleared > 0:
+        ctx.score += (lines_cleared ** 2) * ctx.combo_multiplier
+        ctx.combo_multiplier *= 2
+        ctx.lines_cleared_stage += lines_cleared
+    else:
+        ctx.combo_multiplier = 1
+
+    ctx.fall_delay = max(MIN_FALL_DELAY, ctx.fall_delay - 2)
+    # The new piece starts a fresh gravity interval.
+    ctx.last_fall_ms = pygame.time.get_ticks()
+
+    if ctx.lines_cleared_stage >= ctx.stage_threshold:
+        ctx.grid = create_grid()  # Clear the field on stage clear
+        ctx.lines_cleared_stage -= ctx.stage_threshold
+        ctx.stage += 1
+        ctx.stage_threshold = ctx.stage * STAGE_CLEAR_FACTOR
+        ctx.fall_delay = get_initial_fall_delay(ctx.stage)
+        ctx.state = GameState.STAGE_CLEAR
+
+    ctx.current_piece = ctx.next_piece
+    ctx.current_piece.set_position(GRID_WIDTH // 2, 1)
+    ctx.next_piece = ctx.next_next_piece
+    ctx.next_next_piece = spawn_piece(ctx)
+    if not valid_position(ctx.current_piece, ctx.grid):
+        print("Game Over. Final Score:", ctx.score)
+        ctx.state = GameState.GAME_OVER
+
+def handle_events(ctx: GameContext) -> None:
     """
     Process user events and update the game context accordingly.
-    
+
     Args:
         ctx (GameContext): The game context.
-        fall_event (int): The fall event ID.
     """
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
@@ -406,6 +852,10 @@ def handle_events(ctx: GameContext, fall_event: int) -> None:
             # If paused or stage clear, any key resumes running.
             elif ctx.state in (GameState.PAUSED, GameState.STAGE_CLEAR):
                 ctx.state = GameState.RUNNING
+                # Restart the gravity interval from now, not from pause time.
+                ctx.last_fall_ms = pygame.time.get_ticks()
+                mark_all_dirty(ctx)
+                ctx.dirty = True
                 continue
 
             # At this point, state must be RUNNING.
@@ -413,110 +863,55 @@ def handle_events(ctx: GameContext, fall_event: int) -> None:
 
             if event.key == pygame.K_p:
                 ctx.state = GameState.PAUSED
+                mark_all_dirty(ctx)
+                ctx.dirty = True
                 continue
 
             if event.key == pygame.K_LEFT:
-                new_positions = [(x - 1, y) for (x, y) in ctx.current_piece.get_block_positions()]
-                if valid_position(ctx.current_piece, ctx.grid, new_positions):
-                    ctx.current_piece.x -= 1
+                if valid_position(ctx.current_piece, ctx.grid, dx=-1):
+                    mark_piece_columns_dirty(ctx)
+                    ctx.current_piece.move(-1, 0)
+                    mark_piece_columns_dirty(ctx)
+                    ctx.dirty = True
             elif event.key == pygame.K_RIGHT:
-                new_positions = [(x + 1, y) for (x, y) in ctx.current_piece.get_block_positions()]
-                if valid_position(ctx.current_piece, ctx.grid, new_positions):
-                    ctx.current_piece.x += 1
+                if valid_position(ctx.current_piece, ctx.grid, dx=1):
+                    mark_piece_columns_dirty(ctx)
+                    ctx.current_piece.move(1, 0)
+                    mark_piece_columns_dirty(ctx)
+                    ctx.dirty = True
             elif event.key == pygame.K_DOWN:
-                new_positions = [(x, y + 1) for (x, y) in ctx.current_piece.get_block_positions()]
-                if valid_position(ctx.current_piece, ctx.grid, new_positions):
-                    ctx.current_piece.y += 1
+                if valid_position(ctx.current_piece, ctx.grid, dy=1):
+                    ctx.current_piece.move(0, 1)
+                    mark_piece_columns_dirty(ctx)
+                    ctx.dirty = True
             elif event.key == pygame.K_UP:
                 new_blocks = ctx.current_piece.rotate()
-                rotated_positions = [(ctx.current_piece.x + bx, ctx.current_piece.y + by) for (bx, by) in new_blocks]
-                if valid_position(ctx.current_piece, ctx.grid, rotated_positions):
+                if valid_position(ctx.current_piece, ctx.grid, blocks=new_blocks):
+                    mark_piece_columns_dirty(ctx)
                     ctx.current_piece.apply_rotation(new_blocks)
+                    mark_piece_columns_dirty(ctx)
+                    ctx.dirty = True
             elif event.key == pygame.K_SPACE:
                 # Hard drop
-                while valid_position(ctx.current_piece, ctx.grid):
-                    ctx.current_piece.y += 1
-                ctx.current_piece.y -= 1
-                add_piece_to_grid(ctx.current_piece, ctx.grid)
-                new_grid, lines_cleared = clear_full_lines(ctx.grid)
-                ctx.grid = new_grid
-                if lines_cleared > 0:
-                    ctx.score += (lines_cleared ** 2) * ctx.combo_multiplier
-                    ctx.combo_multiplier *= 2
-                    ctx.lines_cleared_stage += lines_cleared
-                else:
-                    ctx.combo_multiplier = 1
-
-                ctx.fall_delay = max(MIN_FALL_DELAY, ctx.fall_delay - 2)
-                pygame.time.set_timer(fall_event, ctx.fall_delay)
-
-                if ctx.lines_cleared_stage >= ctx.stage_threshold:
-                    ctx.grid = create_grid()  # Clear the field
-                    ctx.lines_cleared_stage -= ctx.stage_threshold
-                    ctx.stage += 1
-                    ctx.stage_threshold = ctx.stage * STAGE_CLEAR_FACTOR
-                    ctx.fall_delay = get_initial_fall_delay(ctx.stage)
-                    pygame.time.set_timer(fall_event, ctx.fall_delay)
-                    ctx.state = GameState.STAGE_CLEAR
-
-                # Set next piece
-                ctx.current_piece = ctx.next_piece
-                ctx.current_piece.x = GRID_WIDTH // 2
-                ctx.current_piece.y = 1
-                effective_weights: List[int] = [max(w - (ctx.stage - 1), 5) for w in base_shape_weights]
-                ctx.next_piece = ctx.next_next_piece
-                ctx.next_next_piece = Piece(random.choices(shapes, weights=effective_weights, k=1)[0], GRID_WIDTH // 2, 1)
-                if not valid_position(ctx.current_piece, ctx.grid):
-                    print("Game Over. Final Score:", ctx.score)
-                    ctx.state = GameState.GAME_OVER
-
-        elif event.type == fall_event and ctx.state == GameState.RUNNING:
-            update_fall(ctx, fall_event)
-
-def update_fall(ctx: GameContext, fall_event: int) -> None:
-    """
-    Process a fall event for the active piece.
+                mark_all_dirty(ctx)
+                ctx.dirty = True
+                ctx.current_piece.move(0, hard_drop_distance(ctx.current_piece, ctx.grid))
+                lock_and_spawn(ctx)
+
+def update_fall(ctx: GameContext) -> None:
+    """
+    Process a gravity step for the active piece.
 
     Args:
         ctx (GameContext): The game context.
-        fall_event (int): The fall event ID.
     """
-    new_y = ctx.current_piece.y + 1
-    new_positions = [(x, y + 1) for (x, y) in ctx.current_piece.get_block_positions()]
-    if valid_position(ctx.current_piece, ctx.grid, new_positions):
-        ctx.current_piece.y = new_y
+    ctx.dirty = True
+    if valid_position(ctx.current_piece, ctx.grid, dy=1):
+        ctx.current_piece.move(0, 1)
+        mark_piece_columns_dirty(ctx)
     else:
-        add_piece_to_grid(ctx.current_piece, ctx.grid)
-        new_grid, lines_cleared = clear_full_lines(ctx.grid)
-        ctx.grid = new_grid
-        if lines_cleared > 0:
-            ctx.score += (lines_cleared ** 2) * ctx.combo_multiplier
-            ctx.combo_multiplier *= 2
-            ctx.lines_cleared_stage += lines_cleared
-        else:
-            ctx.combo_multiplier = 1
-
-        ctx.fall_delay = max(MIN_FALL_DELAY, ctx.fall_delay - 2)
-        pygame.time.set_timer(fall_event, ctx.fall_delay)
-
-        if ctx.lines_cleared_stage >= ctx.stage_threshold:
-            ctx.grid = create_grid()  # Clear the field on stage clear
-            ctx.lines_cleared_stage -= ctx.stage_threshold
-            ctx.stage += 1
-            ctx.stage_threshold = ctx.stage * STAGE_CLEAR_FACTOR
-            ctx.fall_delay = get_initial_fall_delay(ctx.stage)
-            pygame.time.set_timer(fall_event, ctx.fall_delay)
-            ctx.state = GameState.STAGE_CLEAR
-
-        ctx.current_piece = ctx.next_piece
-        ctx.current_piece.x = GRID_WIDTH // 2
-        ctx.current_piece.y = 1
-        effective_weights: List[int] = [max(w - (ctx.stage - 1), 5) for w in base_shape_weights]
-        ctx.next_piece = ctx.next_next_piece
-        ctx.next_next_piece = Piece(random.choices(shapes, weights=effective_weights, k=1)[0], GRID_WIDTH // 2, 1)
-        if not valid_position(ctx.current_piece, ctx.grid):
-            print("Game Over. Final Score:", ctx.score)
-            ctx.state = GameState.GAME_OVER
+        mark_all_dirty(ctx)
+        lock_and_spawn(ctx)
 
 def render_screen(ctx: GameContext, screen: pygame.Surface) -> None:
     """
@@ -526,44 +921,76 @@ def render_screen(ctx: GameContext, screen: pygame.Surface) -> None:
         ctx (GameContext): The game context.
         screen (pygame.Surface): The drawing surface.
     """
-    screen.fill(BG_COLOR)
-    falling_columns: set[int] = { x for (x, _) in ctx.current_piece.get_block_positions() }
-    draw_grid(screen, ctx.grid, falling_columns)
+    # The cached grid layer repaints the whole board area, so no full
+    # screen fill is needed; the HUD side is repainted only when a lock,
+    # clear, or state change touched it.
+    piece = ctx.current_piece
+    b = piece.blocks
+    falling_columns: set[int] = {piece.x + b[0], piece.x + b[2], piece.x + b[4]}
+    draw_grid(screen, ctx, falling_columns)
     draw_piece(screen, ctx.current_piece)
     draw_stage_border(screen)
-    draw_previews(screen, ctx.next_piece, ctx.next_next_piece)
-    lines_remaining: int = ctx.stage_threshold - ctx.lines_cleared_stage
-    draw_info(screen, ctx.score, ctx.stage, lines_remaining)
+    if ctx.hud_dirty:
+        screen.fill(BG_COLOR, HUD_AREA_RECT)
+        draw_previews(screen, ctx.next_piece, ctx.next_next_piece)
+        lines_remaining: int = ctx.stage_threshold - ctx.lines_cleared_stage
+        draw_info(screen, ctx.score, ctx.stage, lines_remaining)
+        ctx.hud_dirty = False
     if ctx.state == GameState.PAUSED:
         draw_pause_message(screen)
     elif ctx.state == GameState.STAGE_CLEAR:
         draw_pause_message(screen, message=f"Stage {ctx.stage-1} Clear!\nPress any key\nto continue.")
     elif ctx.state == GameState.GAME_OVER:
         draw_pause_message(screen, message=f"Game Over.\nFinal Score: {ctx.score}\nPress ESC to exit.")
-    pygame.display.flip()
+    if ctx.dirty_rects:
+        pygame.display.update(ctx.dirty_rects)
+        ctx.dirty_rects.clear()
+    else:
+        # First frame (or no tracked regions): present everything.
+        pygame.display.flip()
 
 def main() -> None:
     """
     Main function to run the TRIOS game.
     """
     pygame.init()
-    screen: pygame.Surface = pygame.display.set_mode((WINDOW_WIDTH_EXTENDED, WINDOW_HEIGHT))
+    screen: pygame.Surface = pygame.display.set_mode(
+        (WINDOW_WIDTH_EXTENDED, WINDOW_HEIGHT), pygame.DOUBLEBUF)
     pygame.display.set_caption("TRIOS")
+    _convert_all_cached_surfaces()
     clock: pygame.time.Clock = pygame.time.Clock()
     
-    # Create a fall event timer ID.
-    fall_event: int = pygame.USEREVENT + 1
-    
+    # Drop event types the game never reads (mouse motion, window events,
+    # ...) at the C layer so they are never built as Python objects.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
     # Initialize game context.
     ctx = GameContext()
-    pygame.time.set_timer(fall_event, ctx.fall_delay)
-    
+    ctx.last_fall_ms = pygame.time.get_ticks()
+
     while not ctx.close_request:
-        clock.tick(FPS)
-        handle_events(ctx, fall_event)
-        # Note: update_fall is handled in handle_events for fall_event
-        render_screen(ctx, screen)
-    
+        # Block until the next input or the next due gravity step instead
+        # of spinning at FPS; in stationary states gravity is suspended, so
+        # wait for input indefinitely.
+        if ctx.state == GameState.RUNNING:
+            remaining = ctx.fall_delay - (pygame.time.get_ticks() - ctx.last_fall_ms)
+            event = pygame.event.wait(timeout=max(remaining, 1))
+        else:
+            event = pygame.event.wait()
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+            handle_events(ctx)
+        if ctx.state == GameState.RUNNING:
+            now = pygame.time.get_ticks()
+            if now - ctx.last_fall_ms >= ctx.fall_delay:
+                update_fall(ctx)
+                ctx.last_fall_ms = now
+        if ctx.dirty:
+            render_screen(ctx, screen)
+            ctx.dirty = False
+            clock.tick(FPS)  # Upper cap on redraw rate while events stream in
+
     pygame.quit()
     sys.exit()
 